@@ -0,0 +1,308 @@
+import os
+import errno
+import mmap
+import shutil
+import stat as stat_module
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+# Fastest available JSON codec: orjson > ujson > stdlib json. The chosen
+# loads/dumps callables are bound once at import; on the stdlib path they are
+# bound methods of single reusable encoder/decoder instances, since
+# json.dumps/json.loads otherwise construct a fresh JSONEncoder/JSONDecoder
+# on every call.
+try:
+    import orjson
+    _JSON_IMPL = "orjson"
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    try:
+        import ujson
+        _JSON_IMPL = "ujson"
+        _json_loads = ujson.loads
+        _json_dumps = ujson.dumps
+    except ImportError:
+        import json
+        _JSON_IMPL = "json"
+        _json_dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        _STDLIB_DECODER = json.JSONDecoder()
+
+        def _json_loads(data):
+            # JSONDecoder.decode only takes str; the callers read bytes.
+            if isinstance(data, (bytes, bytearray)):
+                data = data.decode("utf-8")
+            return _STDLIB_DECODER.decode(data)
+
+logger = logging.getLogger(__name__)
+
+# read_file switches to mmap at this size: below it the mapping setup costs
+# more than it saves; above it the kernel faults pages in directly instead
+# of copying through a stdio buffer.
+_MMAP_READ_THRESHOLD = 128 * 1024
+
+
+@lru_cache(maxsize=4096)
+def _build_info(path: str, size: int, mtime_ns: int, mode: int) -> Dict[str, Any]:
+    """Builds a file-info dict, memoized on the stat identity.
+
+    Agents re-query the same paths constantly; keying on (path, size,
+    mtime_ns, mode) means an unchanged file costs a dict lookup instead of
+    repeating the basename/splitext string work, while any modification
+    changes the key and misses the cache naturally.
+
+    The returned dict is the cached object itself and must not be mutated;
+    callers that hand it out (get_file_info) copy it first.
+    """
+    name = os.path.basename(path)
+    return {
+        "name": name,
+        "type": "dir" if stat_module.S_ISDIR(mode) else "file",
+        "size": size,
+        "extension": os.path.splitext(name)[1],
+        "modified": mtime_ns / 1e9,
+    }
+
+
+class FileTool:
+    """
+    File operations restricted to a base directory.
+
+    All paths are given relative to base_dir and are validated against
+    traversal outside it. Methods log failures and return False/None/[]
+    rather than raising, so agent code can branch on the result directly.
+    """
+
+    def __init__(self, base_dir: str):
+        """
+        Args:
+            base_dir (str): The directory all operations are confined to.
+                            Created if it does not exist.
+        """
+        # realpath once here so the per-call path checks are pure string
+        # work with no cwd or symlink resolution.
+        self.base_dir = os.path.realpath(base_dir)
+        self._base_prefix = self.base_dir + os.path.sep
+        if not os.path.isdir(self.base_dir):
+            os.makedirs(self.base_dir, exist_ok=True)
+        # Directories this tool has already confirmed/created; repeated
+        # ensure-exists calls against the same subtree skip the mkdir
+        # syscall entirely. Invalidated by delete_dir.
+        self._known_dirs: set = {self.base_dir}
+        logger.info(f"FileTool initialized with base directory: {self.base_dir}")
+
+    def _resolve(self, rel_path: str) -> str:
+        """Resolves a relative path inside base_dir, rejecting traversal.
+
+        base_dir is normalized once in __init__, so this hot path is one
+        join + normpath over already-absolute strings: no abspath, no
+        getcwd, and no per-call separator concatenation for the
+        containment check.
+        """
+        full_path = os.path.normpath(os.path.join(self._base_prefix, rel_path))
+        if full_path != self.base_dir and not full_path.startswith(self._base_prefix):
+            raise ValueError(f"Path '{rel_path}' resolves outside the base directory.")
+        return full_path
+
+    # --- Files ---
+
+    def _ensure_parent_dir(self, path: str):
+        """Makes sure the parent directory of path exists, memoized."""
+        parent = os.path.dirname(path)
+        if parent and parent not in self._known_dirs:
+            os.makedirs(parent, exist_ok=True)
+            self._known_dirs.add(parent)
+
+    def read_file(self, rel_path: str) -> Optional[str]:
+        """Returns the text content of a file, or None on failure.
+
+        Large files are read through mmap so pages come straight from the
+        page cache rather than being copied through a userspace buffer
+        first; small files keep the plain read, which is cheaper than
+        setting up a mapping.
+        """
+        try:
+            path = self._resolve(rel_path)
+            if os.path.getsize(path) >= _MMAP_READ_THRESHOLD:
+                with open(path, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if hasattr(mm, "madvise"):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        return mm[:].decode("utf-8")
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        except Exception as e:
+            logger.error(f"Failed to read file '{rel_path}': {e}")
+            return None
+
+    def write_file(self, rel_path: str, content: str) -> bool:
+        """Writes text content to a file, creating parent directories."""
+        try:
+            path = self._resolve(rel_path)
+            self._ensure_parent_dir(path)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to write file '{rel_path}': {e}")
+            return False
+
+    def file_exists(self, rel_path: str) -> bool:
+        """Returns True if the path exists inside the base directory.
+
+        os.access with F_OK answers straight from the kernel; os.path.exists
+        would run a full stat and allocate a stat_result just to be thrown
+        away.
+        """
+        try:
+            return os.access(self._resolve(rel_path), os.F_OK)
+        except Exception as e:
+            logger.error(f"Failed existence check for '{rel_path}': {e}")
+            return False
+
+    def move_file(self, src_rel: str, dst_rel: str) -> bool:
+        """Moves/renames a file within the base directory.
+
+        os.replace is a single atomic rename syscall; shutil.move's extra
+        stat/isdir dispatch is only needed (and only used) when the rename
+        crosses a filesystem boundary.
+        """
+        try:
+            src = self._resolve(src_rel)
+            dst = self._resolve(dst_rel)
+            try:
+                os.replace(src, dst)
+            except OSError as oe:
+                if oe.errno != errno.EXDEV:
+                    raise
+                # Cross-device move: fall back to copy + delete.
+                shutil.move(src, dst)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to move '{src_rel}' to '{dst_rel}': {e}")
+            return False
+
+    def copy_file(self, src_rel: str, dst_rel: str) -> bool:
+        """Copies a file within the base directory.
+
+        shutil.copyfile uses the platform zero-copy path (sendfile /
+        copy_file_range on Linux), so bytes move kernel-to-kernel instead
+        of round-tripping through a Python buffer.
+        """
+        try:
+            src = self._resolve(src_rel)
+            dst = self._resolve(dst_rel)
+            if os.path.isdir(src):
+                shutil.copytree(src, dst)
+            else:
+                shutil.copyfile(src, dst)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to copy '{src_rel}' to '{dst_rel}': {e}")
+            return False
+
+    # --- Directories ---
+
+    def create_dir(self, rel_path: str) -> bool:
+        """Creates a directory (and parents) inside the base directory."""
+        try:
+            path = self._resolve(rel_path)
+            if path in self._known_dirs:
+                return True
+            os.makedirs(path, exist_ok=True)
+            self._known_dirs.add(path)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create directory '{rel_path}': {e}")
+            return False
+
+    def delete_dir(self, rel_path: str) -> bool:
+        """Recursively deletes a directory inside the base directory."""
+        try:
+            path = self._resolve(rel_path)
+            shutil.rmtree(path)
+            # Drop the directory and everything under it from the cache so a
+            # later ensure-exists actually recreates them.
+            prefix = path + os.path.sep
+            self._known_dirs = {
+                d for d in self._known_dirs
+                if d != path and not d.startswith(prefix)
+            }
+            return True
+        except Exception as e:
+            logger.error(f"Failed to delete directory '{rel_path}': {e}")
+            return False
+
+    def list_dir(self, rel_path: str = ".") -> List[Dict[str, Any]]:
+        """Lists a directory as a list of file-info dicts.
+
+        Uses os.scandir: DirEntry carries the type bit from the directory
+        read itself and caches its stat result, so the per-entry
+        stat+isdir syscall pair of the listdir pattern disappears.
+        """
+        try:
+            path = self._resolve(rel_path)
+            entries = []
+            with os.scandir(path) as it:
+                for entry in it:
+                    stat_result = entry.stat(follow_symlinks=False)
+                    entries.append({
+                        "name": entry.name,
+                        "type": "dir" if entry.is_dir(follow_symlinks=False) else "file",
+                        "size": stat_result.st_size,
+                        "extension": os.path.splitext(entry.name)[1],
+                        "modified": stat_result.st_mtime,
+                    })
+            return entries
+        except Exception as e:
+            logger.error(f"Failed to list directory '{rel_path}': {e}")
+            return []
+
+    def get_file_info(self, rel_path: str) -> Optional[Dict[str, Any]]:
+        """Returns name/type/size/extension/mtime metadata for a path.
+
+        One stat establishes the file identity; the dict itself comes from
+        the memoized _build_info, and the mode bit replaces the old extra
+        isdir probe. The copy keeps callers free to mutate their result
+        without poisoning the shared cache entry.
+        """
+        try:
+            path = self._resolve(rel_path)
+            st = os.stat(path)
+            return dict(_build_info(path, st.st_size, st.st_mtime_ns, st.st_mode))
+        except Exception as e:
+            logger.error(f"Failed to get file info for '{rel_path}': {e}")
+            return None
+
+    # --- JSON ---
+
+    def read_json(self, rel_path: str) -> Optional[Dict[str, Any]]:
+        """Parses a JSON file, or returns None on failure.
+
+        Reads bytes and hands them straight to the codec: orjson parses
+        bytes natively, skipping a separate UTF-8 decode pass.
+        """
+        try:
+            path = self._resolve(rel_path)
+            with open(path, "rb") as f:
+                return _json_loads(f.read())
+        except Exception as e:
+            logger.error(f"Failed to read JSON from '{rel_path}': {e}")
+            return None
+
+    def write_json(self, rel_path: str, data: Any) -> bool:
+        """Serializes data as JSON to a file."""
+        try:
+            path = self._resolve(rel_path)
+            self._ensure_parent_dir(path)
+            serialized = _json_dumps(data)
+            # orjson.dumps returns bytes; ujson/json return str.
+            if isinstance(serialized, str):
+                serialized = serialized.encode("utf-8")
+            with open(path, "wb") as f:
+                f.write(serialized)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to write JSON to '{rel_path}': {e}")
+            return False
@@ -6,24 +6,33 @@ from typing import Dict, Any, Optional, List
 from enum import Enum
 import threading
 
-# Import signal emitter safely
-try:
-    from ..ui.signal_emitter import signal_emitter
-    UI_AVAILABLE = True
-except ImportError:
-    UI_AVAILABLE = False
-    # Define a dummy emitter if UI is not available
-    class DummySignalEmitter:
-        def __getattr__(self, name):
-            # Return a dummy signal that does nothing when emitted
-            class DummySignal:
-                def emit(self, *args, **kwargs): pass
-            return DummySignal()
-    signal_emitter = DummySignalEmitter()
-    # logging.info("TaskQueue running without UI signal emitter.") # Less verbose
-
 logger = logging.getLogger(__name__)
 
+# The UI signal emitter transitively imports PyQt6, which is slow to load and
+# may be absent entirely in headless/CLI runs. Resolve it lazily on the first
+# emission instead of at import time so importing the task queue stays cheap.
+_signal_emitter = None
+
+def _get_signal_emitter():
+    """Returns the shared UI signal emitter, importing it on first use.
+    Falls back to a no-op emitter if the UI (or PyQt6) is unavailable."""
+    global _signal_emitter
+    if _signal_emitter is None:
+        try:
+            from ..ui.signal_emitter import signal_emitter
+            _signal_emitter = signal_emitter
+        except ImportError:
+            # Define a dummy emitter if UI is not available
+            class DummySignalEmitter:
+                def __getattr__(self, name):
+                    # Return a dummy signal that does nothing when emitted
+                    class DummySignal:
+                        def emit(self, *args, **kwargs): pass
+                    return DummySignal()
+            _signal_emitter = DummySignalEmitter()
+            logger.debug("TaskQueue running without UI signal emitter.")
+    return _signal_emitter
+
 class TaskStatus(Enum):
     """Represents the status of a task in the queue."""
     PENDING = "PENDING"
@@ -73,7 +82,7 @@ class Task:
             logger.info(f"Task {self.task_id[:8]} status changed from {old_status.name} to {status.name}. Agent: {agent_id or 'N/A'}")
             try:
                 # Emit signal with updated task details
-                signal_emitter.task_status_updated.emit(self.to_dict())
+                _get_signal_emitter().task_status_updated.emit(self.to_dict())
             except Exception as sig_e:
                 logger.error(f"Error emitting task_status_updated signal for {self.task_id[:8]}: {sig_e}", exc_info=False)
 
@@ -127,7 +136,7 @@ class TaskQueue:
         logger.info(f"Task {task.task_id[:8]} added to queue with priority {task.priority}. Queue size: {self.size()}")
         # Emit signal after adding
         try:
-            signal_emitter.task_created.emit(task.to_dict()) # Emit full task data
+            _get_signal_emitter().task_created.emit(task.to_dict()) # Emit full task data
         except Exception as sig_e:
             logger.error(f"Error emitting task_created signal for {task.task_id[:8]}: {sig_e}", exc_info=False)
 
@@ -116,3 +116,6 @@ class CalculatorTool(BaseTool):
             logger.error(f"Tool '{tool_name}': Unexpected error during operation execution: {e}", exc_info=True)
             # --- CORRECTED LINE 141 ---
             return {"status": "error", "error_message": f"An unexpected error occurred while executing tool '{tool_name}': {str(e)}"}
+
+# Exported for ToolManager fast-path discovery (avoids a full member scan).
+TOOL = CalculatorTool
@@ -143,3 +143,6 @@ class FileSystemTool(BaseTool):
             logger.error(f"FileSystemTool Unexpected Error: {e}", exc_info=True)
             return {"status": "error", "error_message": f"An unexpected error occurred: {e}"}
 
+
+# Exported for ToolManager fast-path discovery (avoids a full member scan).
+TOOL = FileSystemTool
@@ -1,8 +1,10 @@
 import os
+import sys
 import importlib
+import importlib.util
 import inspect
 import logging
-from typing import Dict, List, Optional, Type, Any
+from typing import Dict, List, Optional, Tuple, Type, Any
 from .base_tool import BaseTool
 
 logger = logging.getLogger(__name__)
@@ -12,7 +14,19 @@ class ToolManager:
     Manages the discovery, loading, and access of agent tools.
     Tools are discovered from the same directory as this manager.
     Allows passing configuration arguments during tool instantiation.
+
+    Discovery is lazy: scanning the directory only records which module
+    provides which tool; the heavy import/instantiate work happens on the
+    first get_tool() call (or when the full tool set is requested), so
+    application startup does not pay for tools that are never used.
     """
+    # Fixed attribute set: skips the per-instance __dict__ and makes the
+    # attribute reads on the hot get_tool/get_all_tools paths slot lookups.
+    __slots__ = (
+        'tool_directory', 'tool_config', '_tools', '_tools_lc',
+        '_tool_classes', '_pending', '_schemas_cache', '_tools_tuple_cache',
+    )
+
     def __init__(
         self,
         tool_directory: Optional[str] = None,
@@ -25,120 +39,216 @@ class ToolManager:
 
         self.tool_config = tool_config if tool_config else {}
         self._tools: Dict[str, BaseTool] = {}
+        # Parallel lowercase-name index so agents calling tools with case
+        # variations still hit an O(1) lookup instead of missing.
+        self._tools_lc: Dict[str, BaseTool] = {}
         self._tool_classes: Dict[str, Type[BaseTool]] = {}
+        # Maps a tool-name guess derived from the filename ('foo_tool.py' -> 'foo')
+        # to the (module path, file path) that still needs importing.
+        self._pending: Dict[str, Tuple[str, str]] = {}
+        # Memoized list_tools()/get_all_tools() results; rebuilt only when
+        # the tool set changes.
+        self._schemas_cache: Optional[List[Dict[str, Any]]] = None
+        self._tools_tuple_cache: Optional[Tuple[BaseTool, ...]] = None
         logger.info(f"ToolManager initialized. Scanning directory: {self.tool_directory}")
         logger.debug(f"Tool configurations provided: {self.tool_config}")
         logger.debug(f"BaseTool used for checks: {BaseTool} from {inspect.getfile(BaseTool)}")
-        self.discover_and_load_tools()
+        self.discover_tools()
 
-    def discover_and_load_tools(self):
+    def discover_tools(self):
         """
-        Discovers tool classes in the tool directory, instantiates them with
-        provided configuration, and registers them.
+        Scans the tool directory and records pending tool modules without
+        importing them. Actual loading is deferred to first access.
         """
         logger.info(f"Discovering tools in: {self.tool_directory}")
         discovered_count = 0
-        loaded_count = 0
 
         try:
-            logger.debug(f"Files in tool directory: {os.listdir(self.tool_directory)}")
             for filename in os.listdir(self.tool_directory):
-                logger.debug(f"Processing file: {filename}")
-                if filename.endswith("_tool.py") and not filename.startswith("__"):
-                    module_name = filename[:-3] # e.g., 'calculator_tool'
-
-                    # --- CORRECTED PATH CALCULATION ---
-                    # Assumes the script is run from the project root (e.g., CPAS3)
-                    # and the 'modules' directory is directly under it.
-                    # We want a path like 'modules.tools.calculator_tool'
-                    package_name = os.path.basename(self.tool_directory) # 'tools'
-                    parent_package_name = os.path.basename(os.path.dirname(self.tool_directory)) # 'modules'
-                    full_module_path = f"{parent_package_name}.{package_name}.{module_name}"
-                    # --- END CORRECTION ---
-
-                    logger.debug(f"Calculated module path: {full_module_path}")
-
-                    try:
-                        logger.debug(f"Attempting to import module: {full_module_path}")
-                        module = importlib.import_module(full_module_path)
-                        logger.debug(f"Successfully imported module: {full_module_path}")
-
-                        logger.debug(f"Inspecting members of module: {module_name}")
-                        members = inspect.getmembers(module)
-                        logger.debug(f"Found {len(members)} members in {module_name}")
-
-                        for name, obj in members:
-                            logger.debug(f"Checking member: name='{name}', type='{type(obj)}'")
-                            if inspect.isclass(obj):
-                                logger.debug(f"Member '{name}' is a class.")
-                                try:
-                                    # Add a check if obj is BaseTool itself before issubclass
-                                    is_base_tool_itself = (obj is BaseTool)
-                                    logger.debug(f"Is '{name}' the BaseTool itself? {is_base_tool_itself}")
-                                    if is_base_tool_itself:
-                                        logger.debug(f"Skipping class '{name}': Is BaseTool itself.")
-                                        continue # Skip BaseTool itself
-
-                                    # Check inheritance - wrap in try-except for robustness
-                                    is_subclass = issubclass(obj, BaseTool)
-                                    logger.debug(f"Is '{name}' a subclass of {BaseTool}? {is_subclass}")
-
-                                    if is_subclass:
-                                        if name not in self._tool_classes:
-                                            self._tool_classes[name] = obj
-                                            logger.info(f"Discovered tool class: {name} in {filename}")
-                                            discovered_count += 1
-
-                                            try:
-                                                tool_specific_config = self.tool_config.get(name, {})
-                                                logger.debug(f"Attempting to instantiate {name} with config: {tool_specific_config}")
-                                                instance = obj(**tool_specific_config)
-                                                logger.debug(f"Successfully instantiated {name}")
-
-                                                tool_instance_name = instance.name
-                                                if tool_instance_name in self._tools:
-                                                    logger.warning(f"Tool name '{tool_instance_name}' from class {name} conflicts. Overwriting.")
-                                                self._tools[tool_instance_name] = instance
-                                                logger.info(f"Successfully loaded and registered tool: '{tool_instance_name}' (from class {name})")
-                                                loaded_count += 1
-                                            except TypeError as te:
-                                                 logger.error(f"TypeError instantiating {name} from {filename}. Check __init__ args/config. Config: {tool_specific_config}. Error: {te}", exc_info=True)
-                                            except Exception as e:
-                                                 logger.error(f"Failed to instantiate/register tool class {name} from {filename}: {e}", exc_info=True)
-                                    else:
-                                         logger.debug(f"Skipping class '{name}': Not a valid subclass of BaseTool.")
-
-                                except TypeError as e:
-                                     # issubclass can raise TypeError if obj is not a class (though we check inspect.isclass)
-                                     logger.warning(f"Could not perform issubclass check on '{name}': {e}")
-                            else:
-                                 logger.debug(f"Skipping member '{name}': Not a class.")
-
-
-                    except ImportError as e:
-                        logger.error(f"Failed to import module {full_module_path}: {e}", exc_info=True)
-                    except Exception as e:
-                        logger.error(f"Error processing file {filename} or its contents: {e}", exc_info=True)
-                else:
-                    logger.debug(f"Skipping file (doesn't match pattern or is __init__): {filename}")
+                # Cheap rejects first: hidden files, editor/underscore files
+                # (including __init__.py) and anything not matching *_tool.py.
+                if filename.startswith(('_', '.')) or not filename.endswith("_tool.py"):
+                    logger.debug(f"Skipping file (doesn't match pattern): {filename}")
+                    continue
+
+                module_name = filename[:-3] # e.g., 'calculator_tool'
+                if module_name == "base_tool":
+                    continue # framework base class module, not a tool
 
+                # --- CORRECTED PATH CALCULATION ---
+                # Assumes the script is run from the project root (e.g., CPAS3)
+                # and the 'modules' directory is directly under it.
+                # We want a path like 'modules.tools.calculator_tool'
+                package_name = os.path.basename(self.tool_directory) # 'tools'
+                parent_package_name = os.path.basename(os.path.dirname(self.tool_directory)) # 'modules'
+                full_module_path = f"{parent_package_name}.{package_name}.{module_name}"
+                # --- END CORRECTION ---
+
+                # Filename convention gives us the expected tool name
+                # ('calculator_tool.py' -> 'calculator') without importing.
+                tool_name_guess = module_name[:-len("_tool")]
+                file_path = os.path.join(self.tool_directory, filename)
+                self._pending[tool_name_guess] = (full_module_path, file_path)
+                discovered_count += 1
+                logger.debug(f"Recorded pending tool module: '{tool_name_guess}' -> {full_module_path}")
 
         except FileNotFoundError:
             logger.error(f"Tool directory not found: {self.tool_directory}")
         except Exception as e:
             logger.error(f"Failed during tool discovery: {e}", exc_info=True)
 
-        logger.info(f"Tool discovery complete. Discovered {discovered_count} classes, loaded {loaded_count} instances.")
+        logger.info(f"Tool discovery complete. Recorded {discovered_count} pending tool modules (loading deferred).")
+
+    # Kept for backwards compatibility: discovers and then forces all
+    # pending modules to load immediately.
+    def discover_and_load_tools(self):
+        self.discover_tools()
+        self._load_all_pending()
+
+    def _load_all_pending(self):
+        """Materializes every pending tool module."""
+        for tool_name_guess in list(self._pending):
+            self._load_pending(tool_name_guess)
+
+    def _load_pending(self, tool_name_guess: str):
+        """
+        Imports a single pending tool module, instantiating and registering
+        every BaseTool subclass it defines.
+        """
+        pending_entry = self._pending.pop(tool_name_guess, None)
+        if pending_entry is None:
+            return
+        full_module_path, file_path = pending_entry
+
+        # Reuse an already-imported module (tests, multi-agent setups that
+        # build several managers) instead of re-running the importlib
+        # finder/loader machinery for it.
+        module = sys.modules.get(full_module_path)
+        if module is None:
+            try:
+                # The scan already found the exact file, so build the spec
+                # from it directly instead of walking importlib's finder
+                # chain over sys.path again.
+                logger.debug(f"Loading module {full_module_path} from {file_path}")
+                spec = importlib.util.spec_from_file_location(full_module_path, file_path)
+                if spec is None or spec.loader is None:
+                    raise ImportError(f"Could not build spec for {file_path}")
+                module = importlib.util.module_from_spec(spec)
+                # Publish before exec so the module is importable during its
+                # own execution (mirrors regular import semantics).
+                sys.modules[full_module_path] = module
+                spec.loader.exec_module(module)
+                logger.debug(f"Successfully loaded module: {full_module_path}")
+            except ImportError as e:
+                sys.modules.pop(full_module_path, None)
+                logger.error(f"Failed to import module {full_module_path}: {e}", exc_info=True)
+                return
+            except Exception as e:
+                sys.modules.pop(full_module_path, None)
+                logger.error(f"Error loading tool module {full_module_path}: {e}", exc_info=True)
+                return
+
+        # Well-formed tool modules export their tool class through a
+        # module-level TOOL attribute, which lets us skip the full
+        # inspect.getmembers scan over every import in the module.
+        tool_cls = getattr(module, "TOOL", None)
+        if inspect.isclass(tool_cls) and tool_cls is not BaseTool and issubclass(tool_cls, BaseTool):
+            self._register_tool_class(tool_cls.__name__, tool_cls, full_module_path)
+            return
+
+        # Fallback for modules without a TOOL attribute: scan class members.
+        # The predicate filters non-classes inside getmembers, and a single
+        # EAFP issubclass attempt replaces the old isclass/identity/issubclass
+        # chain of per-member lookups.
+        for name, obj in inspect.getmembers(module, inspect.isclass):
+            try:
+                if obj is BaseTool or not issubclass(obj, BaseTool):
+                    continue
+            except TypeError:
+                # issubclass can still balk at exotic class-likes; skip them.
+                continue
+
+            self._register_tool_class(name, obj, full_module_path)
+
+    def _register_tool_class(self, name: str, obj: Type[BaseTool], full_module_path: str):
+        """Instantiates a discovered tool class and registers the instance."""
+        if name in self._tool_classes:
+            return
+        self._tool_classes[name] = obj
+        logger.info(f"Discovered tool class: {name} in {full_module_path}")
+
+        try:
+            tool_specific_config = self.tool_config.get(name, {})
+            logger.debug(f"Attempting to instantiate {name} with config: {tool_specific_config}")
+            instance = obj(**tool_specific_config)
+
+            # Discovery already verified the class via issubclass, so skip
+            # the public register_tool isinstance re-check.
+            self._register_tool_unchecked(instance)
+            logger.info(f"Successfully loaded and registered tool: '{instance.name}' (from class {name})")
+        except TypeError as te:
+            logger.error(f"TypeError instantiating {name} from {full_module_path}. Check __init__ args/config. Config: {tool_specific_config}. Error: {te}", exc_info=True)
+        except Exception as e:
+            logger.error(f"Failed to instantiate/register tool class {name} from {full_module_path}: {e}", exc_info=True)
+
+    def register_tool(self, tool_instance: BaseTool):
+        """Registers an externally constructed tool instance."""
+        if not isinstance(tool_instance, BaseTool):
+            raise TypeError(f"register_tool expects a BaseTool instance, got {type(tool_instance)}")
+        self._register_tool_unchecked(tool_instance)
+        logger.info(f"Registered tool: '{tool_instance.name}'")
+
+    def _register_tool_unchecked(self, tool_instance: BaseTool):
+        """Registration fast path for instances already validated by the
+        caller (discovery checks issubclass; register_tool checks isinstance).
+        """
+        tool_name = tool_instance.name
+        if tool_name in self._tools:
+            logger.warning(f"Tool name '{tool_name}' already registered. Overwriting.")
+        self._tools[tool_name] = tool_instance
+        self._tools_lc[tool_name.lower()] = tool_instance
+        self._schemas_cache = None
+        self._tools_tuple_cache = None
 
-    # --- Rest of the ToolManager class remains the same ---
     def get_tool(self, tool_name: str) -> Optional[BaseTool]:
         tool = self._tools.get(tool_name)
+        if tool is not None:
+            return tool
+        lowered = tool_name.lower()
+        tool = self._tools_lc.get(lowered)
+        if tool is None:
+            if tool_name in self._pending:
+                self._load_pending(tool_name)
+            elif lowered in self._pending:
+                self._load_pending(lowered)
+            tool = self._tools.get(tool_name) or self._tools_lc.get(lowered)
+            if tool is None and self._pending:
+                # The pending keys are filename guesses ('file_system' for
+                # FileSystemTool, whose declared name is 'file_system_tool'),
+                # so a miss there doesn't mean the tool doesn't exist.
+                # Materialize whatever is left before giving up.
+                self._load_all_pending()
+                tool = self._tools.get(tool_name) or self._tools_lc.get(lowered)
         return tool
 
-    def get_all_tools(self) -> List[BaseTool]:
-        return list(self._tools.values())
+    def get_all_tools(self) -> Tuple[BaseTool, ...]:
+        """Returns all loaded tools as a cached, immutable tuple.
+
+        The same tuple object is returned until the tool set changes, so the
+        hot agent loop doesn't allocate a fresh list every reasoning step.
+        Callers must not mutate the result.
+        """
+        self._load_all_pending()
+        if self._tools_tuple_cache is None:
+            self._tools_tuple_cache = tuple(self._tools.values())
+        return self._tools_tuple_cache
 
     def list_tools(self) -> List[Dict[str, Any]]:
+        self._load_all_pending()
+        # LLM prompt assembly calls this every turn; the schema dicts are
+        # immutable post-init, so rebuild only when the tool set changes.
+        if self._schemas_cache is not None:
+            return self._schemas_cache
         tool_list = []
         for name, tool in self._tools.items():
             try:
@@ -153,6 +263,7 @@ class ToolManager:
                 tool_list.append(tool_schema)
             except Exception as e:
                 logger.error(f"Failed to get schema for tool '{name}': {e}", exc_info=True)
+        self._schemas_cache = tool_list
         return tool_list
 
     def use_tool(self, tool_name: str, **kwargs: Any) -> Dict[str, Any]:
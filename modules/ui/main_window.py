@@ -1,10 +1,11 @@
 import logging
 from PyQt6.QtWidgets import (
     QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QLabel, QPushButton,
-    QListWidget, QListWidgetItem, QTextEdit, QLineEdit, QSplitter, QDialog, QFormLayout,
+    QListWidget, QListWidgetItem, QPlainTextEdit, QLineEdit, QSplitter, QDialog, QFormLayout,
     QMessageBox
 )
-from PyQt6.QtCore import pyqtSlot, Qt, QObject # Import QObject for type hint if needed
+from PyQt6.QtCore import pyqtSlot, Qt, QObject, QTimer # Import QObject for type hint if needed
+from PyQt6.QtGui import QTextCursor
 from typing import Optional # Import Optional
 
 # Import backend types for type hinting
@@ -24,6 +25,13 @@ from .signal_emitter import signal_emitter
 
 logger = logging.getLogger(__name__)
 
+# History-entry framing, hoisted to module level so the per-entry work in
+# append_history only pays for the variable parts.
+_HISTORY_HDR_OPEN = "--- "
+_HISTORY_HDR_MID = " ["
+_HISTORY_HDR_CLOSE = "] ---\n"
+_HISTORY_ENTRY_SEP = "\n\n"
+
 class MainWindow(QMainWindow):
     """Main application window."""
 
@@ -67,8 +75,20 @@ class MainWindow(QMainWindow):
         self._right_pane = QWidget()
         self._right_layout = QVBoxLayout(self._right_pane)
         self._right_layout.addWidget(QLabel("Agent History / Output"))
-        self.agent_details_area = QTextEdit() # History / Output display
+        # QPlainTextEdit: the history is plain text only, and its dedicated
+        # scrollback path appends in amortized O(1) without rich-text
+        # fragments per line.
+        self.agent_details_area = QPlainTextEdit() # History / Output display
         self.agent_details_area.setReadOnly(True)
+        # Cap scrollback so long-running sessions don't degrade layout speed.
+        self.agent_details_area.setMaximumBlockCount(5000)
+        # History entries arriving in rapid bursts (streaming agents) are
+        # queued and flushed at most once per frame instead of per entry.
+        self._pending_history: list = []
+        self._history_flush_timer = QTimer(self)
+        self._history_flush_timer.setInterval(16)
+        self._history_flush_timer.setSingleShot(True)
+        self._history_flush_timer.timeout.connect(self._flush_history)
         self._right_layout.addWidget(self.agent_details_area, 1) # Give stretch
 
         # --- Task Input Area (Bottom of Right Pane) ---
@@ -150,20 +170,20 @@ class MainWindow(QMainWindow):
             if agent_id:
                 self.selected_agent_id = agent_id
                 logger.info(f"Agent selected: {current.text()}")
-                self.agent_details_area.clear()
+                self._clear_history_display()
                 # TODO (Optional): Load existing history
                 self.task_input_field.setEnabled(True)
                 self.submit_task_button.setEnabled(True)
             else:
                 logger.warning("Selected list item has no agent ID data.")
                 self.selected_agent_id = None
-                self.agent_details_area.clear()
+                self._clear_history_display()
                 self.agent_details_area.setPlaceholderText("Select an agent to see details.")
                 self.task_input_field.setEnabled(False)
                 self.submit_task_button.setEnabled(False)
         else:
             self.selected_agent_id = None
-            self.agent_details_area.clear()
+            self._clear_history_display()
             self.agent_details_area.setPlaceholderText("Select an agent to see details.")
             self.task_input_field.setEnabled(False)
             self.submit_task_button.setEnabled(False)
@@ -184,17 +204,24 @@ class MainWindow(QMainWindow):
 
         logger.info(f"Submitting task '{task_description}' for agent {self.selected_agent_id[:8]}")
 
+        # Clear the input right away so the click echoes immediately, then
+        # hand the task to the backend on the next event-loop turn instead of
+        # synchronously inside the click handler. A slow assign_task can no
+        # longer freeze the button press.
+        self.task_input_field.clear()
+        QTimer.singleShot(0, lambda desc=task_description: self._dispatch_task(desc))
+
+    def _dispatch_task(self, task_description: str):
+        """Creates the task and hands it to the agent manager."""
         try:
              task = AgentTask(description=task_description)
              success = self.agent_manager.assign_task(task)
 
-             if success:
-                  self.task_input_field.clear()
-             else:
+             if not success:
                   QMessageBox.critical(self, "Task Error", "Failed to add task to the queue (manager returned False).")
 
         except Exception as e:
-             logger.error(f"Error submitting task for agent {self.selected_agent_id[:8]}: {e}", exc_info=True)
+             logger.error(f"Error submitting task: {e}", exc_info=True)
              QMessageBox.critical(self, "Task Submission Error", f"Failed to submit task:\n{e}")
 
 
@@ -274,7 +301,7 @@ class MainWindow(QMainWindow):
                  self.agent_list_widget.takeItem(row)
                  if self.selected_agent_id == agent_id:
                       self.selected_agent_id = None
-                      self.agent_details_area.clear()
+                      self._clear_history_display()
                       self.agent_details_area.setPlaceholderText("Select an agent to see details.")
                       self.task_input_field.setEnabled(False)
                       self.submit_task_button.setEnabled(False)
@@ -313,12 +340,38 @@ class MainWindow(QMainWindow):
             timestamp = history_entry.get('timestamp', '')
             logger.info(f"[UI SLOT] Agent History Update for selected agent: {agent_id[:8]} - Type: {entry_type}")
 
-            self.agent_details_area.append(f"--- {timestamp} [{entry_type.upper()}] ---")
-            self.agent_details_area.append(content)
-            self.agent_details_area.append("")
+            self._pending_history.append(
+                _HISTORY_HDR_OPEN + str(timestamp) + _HISTORY_HDR_MID + entry_type.upper()
+                + _HISTORY_HDR_CLOSE + str(content) + _HISTORY_ENTRY_SEP
+            )
+            if not self._history_flush_timer.isActive():
+                self._history_flush_timer.start()
         else:
              logger.debug(f"[UI SLOT] Ignoring history update for non-selected agent: {agent_id[:8]}")
 
+    def _flush_history(self):
+        """Writes all queued history entries to the display in one insertion.
+
+        Insert at the end via a cursor instead of append(): one layout pass
+        per flush, and cost stays proportional to the flushed text, not the
+        whole scrollback.
+        """
+        if not self._pending_history:
+            return
+        text = "".join(self._pending_history)
+        self._pending_history.clear()
+        cursor = self.agent_details_area.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+        self.agent_details_area.setTextCursor(cursor)
+        self.agent_details_area.ensureCursorVisible()
+
+    def _clear_history_display(self):
+        """Clears the history display and any entries still queued for it."""
+        self._pending_history.clear()
+        self._history_flush_timer.stop()
+        self.agent_details_area.clear()
+
     # *** ADDED this missing slot method ***
     @pyqtSlot(dict)
     def handle_task_created(self, task_dict: dict):
@@ -0,0 +1,690 @@
+import atexit
+import html
+import logging
+import datetime
+import re
+import time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QWidget, QLabel, QPushButton,
+    QLineEdit, QTabWidget, QTableView, QTextEdit, QHeaderView
+)
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QTimer, QThread, QObject,
+    pyqtSignal, pyqtSlot
+)
+
+# pymongo is an optional dependency: the browser degrades to an error label
+# when it (or the server) is unavailable.
+try:
+    from pymongo import MongoClient
+    PYMONGO_AVAILABLE = True
+except ImportError:
+    MongoClient = None
+    PYMONGO_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MONGO_URI = "mongodb://localhost:27017/"
+MONGO_DB_NAME = "cpas3_memory"
+
+# URIs whose server has already answered a ping this process; reopening the
+# browser skips the redundant round trip.
+_pinged_uris: set = set()
+
+
+@lru_cache(maxsize=4)
+def get_mongo_client(uri: str) -> "MongoClient":
+    """Returns the shared MongoClient for a URI.
+
+    Every MongoClient spawns its own monitor threads and performs the SDAM
+    handshake, so constructing one per dialog leaked threads and added
+    latency each time the browser was opened. The cache hands back one
+    client per URI for the life of the process; clients are closed at
+    interpreter exit.
+    """
+    client = MongoClient(uri, serverSelectionTimeoutMS=2000)
+    atexit.register(client.close)
+    return client
+
+
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+
+@lru_cache(maxsize=4096)
+def _fmt_ts_str(value: str) -> str:
+    """Parses and formats an ISO-format timestamp string, memoized.
+
+    format_timestamp runs once per visible timestamp cell, and events that
+    share a second share the exact raw string, so repeats are common enough
+    that caching turns most calls into a dict lookup.
+    """
+    try:
+        parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return parsed.strftime(_TS_FMT)
+    except ValueError:
+        return value
+
+
+# Regex metacharacters; input without any of these is plain text and can be
+# searched with a left-anchored prefix pattern instead of a full regex.
+_REGEX_SPECIAL_CHARS = re.compile(r"[.^$*+?()[\]{}|\\]")
+
+
+class TabSpec(NamedTuple):
+    """Everything that distinguishes one browser tab from another."""
+    key: str                             # attribute/tab identifier
+    label: str                           # tab label
+    collection: str                      # MongoDB collection name
+    details_title: str                   # detail-dialog title
+    sort_key: str                        # newest-first sort field
+    columns: Tuple[Tuple[str, str], ...] # (header label, document field)
+    search_fields: Tuple[str, ...]       # fields the search box matches
+    truncate_field: Optional[str] = None # long field truncated server-side
+
+
+TAB_SPECS: Tuple[TabSpec, ...] = (
+    TabSpec("user_inputs", "User Inputs", "user_inputs", "User Input", "timestamp",
+            (("Timestamp", "timestamp"), ("Session ID", "session_id"), ("Query", "query")),
+            ("query",)),
+    TabSpec("agent_responses", "Agent Responses", "agent_responses", "Agent Response", "timestamp",
+            (("Timestamp", "timestamp"), ("Session ID", "session_id"),
+             ("Agent Type", "agent_type"), ("Query", "query"), ("Response", "response")),
+            ("query", "response"), truncate_field="response"),
+    TabSpec("errors", "Errors", "errors", "Error", "timestamp",
+            (("Timestamp", "timestamp"), ("Session ID", "session_id"),
+             ("Error", "error"), ("Context", "context")),
+            ("error",)),
+    TabSpec("memory", "Memory", "memory", "Memory", "created_at",
+            (("Created", "created_at"), ("Type", "memory_type"), ("Content", "content")),
+            ("content",), truncate_field="content"),
+)
+
+_TAB_SPECS_BY_KEY: Dict[str, TabSpec] = {spec.key: spec for spec in TAB_SPECS}
+
+
+class MongoDocsModel(QAbstractTableModel):
+    """
+    Table model over a list of MongoDB documents.
+
+    Holds the raw document dicts and formats cells on demand in data(), so
+    off-screen rows are never formatted and refreshing is a single model
+    reset instead of a per-cell item rebuild.
+    """
+
+    # Display-role truncation for long text fields (responses, memory content).
+    MAX_CELL_CHARS = 100
+
+    def __init__(self, columns: Tuple[Tuple[str, str], ...], browser: "MemoryBrowser", parent=None):
+        """
+        Args:
+            columns: Tuple of (header label, document field) pairs.
+            browser: Owning browser, used for timestamp formatting.
+        """
+        super().__init__(parent)
+        self._columns = columns
+        self._browser = browser
+        self._rows: List[Dict[str, Any]] = []
+
+    def set_rows(self, rows: List[Dict[str, Any]]):
+        """Replaces the backing documents.
+
+        Refreshes usually return the same window of documents; when the _id
+        sequence is identical a dataChanged over the existing extent is
+        emitted instead of a full model reset, which keeps the view's
+        selection and scroll position and skips the reset/relayout cost.
+        """
+        if self._rows and len(rows) == len(self._rows):
+            unchanged = all(
+                new.get("_id") == old.get("_id")
+                for new, old in zip(rows, self._rows)
+            )
+            if unchanged:
+                self._rows = rows
+                self.dataChanged.emit(
+                    self.index(0, 0),
+                    self.index(len(rows) - 1, len(self._columns) - 1),
+                )
+                return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def append_rows(self, rows: List[Dict[str, Any]]):
+        """Appends documents without a full reset, for progressive fill."""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def document(self, row: int) -> Optional[Dict[str, Any]]:
+        """Returns the raw document backing the given row."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._columns[section][0]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        field = self._columns[index.column()][1]
+        value = self._rows[index.row()].get(field, "")
+        if field in ("timestamp", "created_at"):
+            return self._browser.format_timestamp(value)
+        text = str(value)
+        if len(text) > self.MAX_CELL_CHARS:
+            text = text[:self.MAX_CELL_CHARS] + "..."
+        return text
+
+
+class MongoFetchWorker(QObject):
+    """
+    Executes MemoryBrowser queries on a worker thread.
+
+    Lives on a QThread owned by the browser; fetch requests arrive through a
+    queued signal connection and results travel back the same way, so cursor
+    iteration never blocks the GUI thread.
+    """
+
+    resultsReady = pyqtSignal(str, int, list, bool)
+
+    # Documents are forwarded to the GUI in chunks of this size so the view
+    # paints progressively while the cursor is still draining.
+    CHUNK_ROWS = 25
+
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self._db = db
+
+    @pyqtSlot(str, int, dict)
+    def run(self, tab_key: str, seq: int, spec: Dict[str, Any]):
+        """Runs one fetch described by spec and emits the documents."""
+        self._execute(tab_key, seq, spec)
+
+    @pyqtSlot(list)
+    def run_many(self, requests: list):
+        """Runs a batch of fetches concurrently (one per tab on refresh).
+
+        pymongo clients are thread-safe, so the four tab queries can overlap
+        on a small pool instead of queueing behind each other; signal
+        emission from pool threads is safe because the connection back to
+        the GUI is queued.
+        """
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for tab_key, seq, spec in requests:
+                pool.submit(self._execute, tab_key, seq, spec)
+
+    def _execute(self, tab_key: str, seq: int, spec: Dict[str, Any]):
+        """Cursor-draining core shared by run and run_many.
+
+        Every tab shows at most 100 rows, so batch_size(100)/batchSize=100
+        pins the fetch to a single server round trip instead of pymongo's
+        default 101-then-16MiB batching.
+        """
+        try:
+            collection = self._db[spec["collection"]]
+            limit = spec.get("limit", 100)
+            if "pipeline" in spec:
+                cursor = collection.aggregate(spec["pipeline"], batchSize=limit)
+            else:
+                cursor = (collection.find(spec["query"], spec.get("projection"))
+                          .sort(spec["sort_key"], -1)
+                          .skip(spec.get("skip", 0))
+                          .limit(limit)
+                          .batch_size(limit))
+            # Stream the cursor instead of materializing list(cursor): peak
+            # memory is one chunk, and the first rows land before the last
+            # ones have even been decoded.
+            first = True
+            chunk: List[Dict[str, Any]] = []
+            for doc in cursor:
+                chunk.append(doc)
+                if len(chunk) >= self.CHUNK_ROWS:
+                    self.resultsReady.emit(tab_key, seq, chunk, first)
+                    first = False
+                    chunk = []
+            # Final (possibly empty) chunk; an empty first chunk still has to
+            # go out so a no-results search clears the table.
+            self.resultsReady.emit(tab_key, seq, chunk, first)
+        except Exception as e:
+            logger.error(f"MemoryBrowser fetch for '{tab_key}' failed: {e}", exc_info=True)
+            self.resultsReady.emit(tab_key, seq, [], True)
+
+
+class MemoryBrowser(QDialog):
+    """
+    Browser dialog over the cpas3_memory MongoDB database.
+
+    Four tabs (user inputs, agent responses, errors, memory) each show the
+    latest 100 documents of their collection in a QTableView backed by a
+    MongoDocsModel; clicking a row opens the full document. Queries run on a
+    MongoFetchWorker thread and stale results (superseded by a newer search)
+    are dropped by sequence number.
+    """
+
+    fetch_requested = pyqtSignal(str, int, dict)
+    prefetch_requested = pyqtSignal(list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        logger.info("Initializing MemoryBrowser...")
+        self.setWindowTitle("Memory Browser")
+        self.resize(1000, 700)
+
+        self.client = None
+        self.db = None
+        self._layout = QVBoxLayout(self)
+
+        if not self.init_mongo_connection():
+            error_label = QLabel(
+                "Could not connect to MongoDB. Is the server running "
+                f"at {MONGO_URI}?"
+            )
+            error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self._layout.addWidget(error_label)
+            return
+
+        self.tab_widget = QTabWidget()
+        self._layout.addWidget(self.tab_widget)
+
+        # Worker thread that owns all query execution.
+        self._fetch_seq: Dict[str, int] = {}
+        # Last-built search filter, keyed by (text, fields): the debounce
+        # timer and prefetch both rebuild queries, often for the same input.
+        self._last_query_cache: Optional[Tuple[Tuple[str, Tuple[str, ...]], Dict[str, Any]]] = None
+        # Tabs whose columns have had their one-time fit-to-contents pass.
+        self._fitted_tabs: set = set()
+        # view -> (details title, model, collection), consulted by the one
+        # shared row-click handler.
+        self._detail_specs: Dict[Any, Tuple[str, MongoDocsModel, Any]] = {}
+        # tab key -> (search input, view, model), populated by _build_tab.
+        self._tabs: Dict[str, Tuple[QLineEdit, QTableView, MongoDocsModel]] = {}
+        # Pagination: current zero-based page per tab, plus a short-lived
+        # cache of estimated collection counts for the page labels.
+        self._page_size = 100
+        self._pages: Dict[str, int] = {}
+        self._page_labels: Dict[str, QLabel] = {}
+        self._count_cache: Dict[str, Tuple[float, int]] = {}
+        self._fetch_thread = QThread(self)
+        self._fetch_worker = MongoFetchWorker(self.db)
+        self._fetch_worker.moveToThread(self._fetch_thread)
+        self.fetch_requested.connect(self._fetch_worker.run)
+        self.prefetch_requested.connect(self._fetch_worker.run_many)
+        self._fetch_worker.resultsReady.connect(self._on_results_ready)
+        self._fetch_thread.start()
+
+        # Debounce keystroke-driven searches: the reload fires 150 ms after
+        # the user stops typing instead of once per character.
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.load_data)
+
+        for spec in TAB_SPECS:
+            self._build_tab(spec)
+
+        # All four tabs are prefetched together, so flipping tabs right
+        # after a refresh costs no extra queries.
+        self.prefetch_all()
+
+    # --- Connection ---
+
+    def init_mongo_connection(self) -> bool:
+        """Connects to MongoDB and resolves the collection handles."""
+        if not PYMONGO_AVAILABLE:
+            logger.error("pymongo is not installed; MemoryBrowser is unavailable.")
+            return False
+        try:
+            self.client = get_mongo_client(MONGO_URI)
+            if MONGO_URI not in _pinged_uris:
+                self.client.admin.command("ping")
+                _pinged_uris.add(MONGO_URI)
+            self.db = self.client[MONGO_DB_NAME]
+            self.user_inputs_collection = self.db["user_inputs"]
+            self.agent_responses_collection = self.db["agent_responses"]
+            self.errors_collection = self.db["errors"]
+            self.memory_collection = self.db["memory"]
+            self._ensure_indexes()
+            logger.info(f"MemoryBrowser connected to MongoDB database '{MONGO_DB_NAME}'.")
+            return True
+        except Exception as e:
+            logger.error(f"MemoryBrowser failed to connect to MongoDB: {e}", exc_info=True)
+            return False
+
+    def _ensure_indexes(self):
+        """Creates the sort and text-search indexes the tab queries rely on.
+
+        Sorting by timestamp/created_at with limit(100) becomes an index scan
+        instead of a full collection scan, and free-text search can use the
+        text indexes rather than unanchored regex scans. create_index is
+        idempotent, so repeated startups are harmless.
+        """
+        self._text_indexes_ok = False
+        try:
+            self.user_inputs_collection.create_index([("timestamp", -1)])
+            self.agent_responses_collection.create_index([("timestamp", -1), ("agent_type", 1)])
+            self.errors_collection.create_index([("timestamp", -1)])
+            self.memory_collection.create_index([("created_at", -1)])
+
+            self.user_inputs_collection.create_index([("query", "text")])
+            self.agent_responses_collection.create_index([("query", "text"), ("response", "text")])
+            self.errors_collection.create_index([("error", "text")])
+            self.memory_collection.create_index([("content", "text")])
+            self._text_indexes_ok = True
+        except Exception as e:
+            # Index creation can fail on restricted deployments; the queries
+            # still work, just without index support.
+            logger.warning(f"Could not create MemoryBrowser indexes: {e}")
+
+    # --- Tab construction ---
+
+    def _build_tab(self, spec: TabSpec):
+        """Builds one tab (search bar, paging, table) from its TabSpec."""
+        tab_key, label, columns = spec.key, spec.label, spec.columns
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+
+        search_layout = QHBoxLayout()
+        search_input = QLineEdit()
+        search_input.setPlaceholderText(f"Search {label.lower()}...")
+        search_input.textChanged.connect(
+            lambda _text, key=tab_key: self._on_search_edited(key))
+        search_input.returnPressed.connect(self._search_now)
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.prefetch_all)
+        prev_button = QPushButton("Prev")
+        prev_button.clicked.connect(lambda _checked, key=tab_key: self._change_page(key, -1))
+        next_button = QPushButton("Next")
+        next_button.clicked.connect(lambda _checked, key=tab_key: self._change_page(key, 1))
+        page_label = QLabel()
+        self._page_labels[tab_key] = page_label
+        search_layout.addWidget(search_input)
+        search_layout.addWidget(refresh_button)
+        search_layout.addWidget(prev_button)
+        search_layout.addWidget(page_label)
+        search_layout.addWidget(next_button)
+        layout.addLayout(search_layout)
+
+        model = MongoDocsModel(columns, self)
+        view = QTableView()
+        view.setModel(model)
+        view.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        view.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        view.verticalHeader().setVisible(False)
+        header = view.horizontalHeader()
+        # Interactive sizing with fixed initial widths: resizing to contents
+        # on refresh would re-measure every cell, O(rows x cols), each time.
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setStretchLastSection(True)
+        for column_index, (_header_label, field) in enumerate(columns):
+            view.setColumnWidth(
+                column_index, 150 if field in ("timestamp", "created_at") else 200)
+        # One shared handler for every table; the sender identifies the tab.
+        view.clicked.connect(self._on_row_clicked)
+        layout.addWidget(view)
+
+        self.tab_widget.addTab(tab, label)
+        self._tabs[tab_key] = (search_input, view, model)
+        self._detail_specs[view] = (spec.details_title, model, self.db[spec.collection])
+
+    # --- Data loading ---
+
+    def _search_now(self):
+        """Immediate-fire path for Enter: skip the debounce delay."""
+        self._search_timer.stop()
+        self.load_data()
+
+    def _on_search_edited(self, tab_key: str):
+        """Resets paging for a tab whose search text changed, then debounces."""
+        self._pages[tab_key] = 0
+        self._search_timer.start()
+
+    def _change_page(self, tab_key: str, delta: int):
+        """Moves a tab one page backward/forward and reloads it."""
+        new_page = max(0, self._pages.get(tab_key, 0) + delta)
+        if new_page == self._pages.get(tab_key, 0):
+            return
+        self._pages[tab_key] = new_page
+        self._load_tab(_TAB_SPECS_BY_KEY[tab_key])
+
+    def _estimated_total(self, tab_key: str) -> int:
+        """Estimated document count for a tab's collection, cached ~30s.
+
+        estimated_document_count reads collection metadata (O(1)) instead of
+        scanning like count_documents, and even that round trip is skipped
+        while a cached value is fresh.
+        """
+        cached = self._count_cache.get(tab_key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < 30.0:
+            return cached[1]
+        try:
+            collection_name = _TAB_SPECS_BY_KEY[tab_key].collection
+            total = self.db[collection_name].estimated_document_count()
+        except Exception as e:
+            logger.warning(f"Could not estimate document count for '{tab_key}': {e}")
+            total = 0
+        self._count_cache[tab_key] = (now, total)
+        return total
+
+    def _update_page_label(self, tab_key: str):
+        page = self._pages.get(tab_key, 0)
+        total_pages = self._estimated_total(tab_key) // self._page_size + 1
+        self._page_labels[tab_key].setText(f"Page {page + 1} of ~{total_pages}")
+
+    def load_data(self):
+        """Reloads the currently visible tab."""
+        index = self.tab_widget.currentIndex()
+        if 0 <= index < len(TAB_SPECS):
+            self._load_tab(TAB_SPECS[index])
+
+    def _search_query(self, search_text: str, fields: Tuple[str, ...]) -> Dict[str, Any]:
+        """Builds the find() filter for a free-text search over the fields."""
+        search_text = search_text.strip()
+        if not search_text:
+            return {}
+        cache_key = (search_text, fields)
+        if self._last_query_cache is not None and self._last_query_cache[0] == cache_key:
+            return self._last_query_cache[1]
+        if self._text_indexes_ok:
+            # Served by the per-collection text index (IXSCAN, not COLLSCAN).
+            query = {"$text": {"$search": search_text}}
+        elif _REGEX_SPECIAL_CHARS.search(search_text) is None:
+            # Plain input: anchor it as a case-sensitive prefix so a regular
+            # index on the field can serve the match. An unanchored
+            # case-insensitive regex always forces a collection scan.
+            pattern = f"^{re.escape(search_text)}"
+            clauses = [{field: {"$regex": pattern}} for field in fields]
+            query = clauses[0] if len(clauses) == 1 else {"$or": clauses}
+        else:
+            # The user typed an actual pattern; keep the permissive form.
+            clauses = [{field: {"$regex": search_text, "$options": "i"}} for field in fields]
+            query = clauses[0] if len(clauses) == 1 else {"$or": clauses}
+        self._last_query_cache = (cache_key, query)
+        return query
+
+    def _request_fetch(self, tab_key: str, spec: Dict[str, Any]):
+        """Queues a fetch on the worker thread, superseding older requests."""
+        seq = self._fetch_seq.get(tab_key, 0) + 1
+        self._fetch_seq[tab_key] = seq
+        self._update_page_label(tab_key)
+        self.fetch_requested.emit(tab_key, seq, spec)
+
+    @pyqtSlot(str, int, list, bool)
+    def _on_results_ready(self, tab_key: str, seq: int, docs: list, is_first: bool):
+        """Consumes one worker result chunk, dropping any superseded by a
+        newer search. The first chunk resets the model; later chunks append.
+        """
+        if seq != self._fetch_seq.get(tab_key):
+            return
+        _search_input, view, model = self._tabs[tab_key]
+        if is_first:
+            model.set_rows(docs)
+            if tab_key not in self._fitted_tabs:
+                # One content fit per tab, on its very first populate, after
+                # the event loop has laid the view out.
+                self._fitted_tabs.add(tab_key)
+                QTimer.singleShot(0, view.resizeColumnsToContents)
+        else:
+            model.append_rows(docs)
+
+    def prefetch_all(self):
+        """Refreshes every tab in one batch of concurrent queries."""
+        requests = []
+        for spec in TAB_SPECS:
+            seq = self._fetch_seq.get(spec.key, 0) + 1
+            self._fetch_seq[spec.key] = seq
+            self._update_page_label(spec.key)
+            requests.append((spec.key, seq, self._build_fetch_spec(spec)))
+        self.prefetch_requested.emit(requests)
+
+    def _load_tab(self, spec: TabSpec):
+        """Queues a refresh of one tab."""
+        self._request_fetch(spec.key, self._build_fetch_spec(spec))
+
+    def _build_fetch_spec(self, spec: TabSpec) -> Dict[str, Any]:
+        """Builds the worker fetch spec for one tab from its TabSpec.
+
+        Tabs without a truncate_field use a plain projected find; tabs with
+        one use an aggregation whose $project truncates the long field
+        server-side (with the overflow ellipsis precomputed via $cond), so
+        the BSON decoder only ever sees preview-sized strings. $substrCP
+        rather than $substrBytes so a multi-byte character is never split
+        mid-sequence.
+        """
+        search_input = self._tabs[spec.key][0]
+        query = self._search_query(search_input.text(), spec.search_fields)
+        skip = self._pages.get(spec.key, 0) * self._page_size
+
+        if spec.truncate_field is None:
+            # Only the displayed fields leave the server.
+            projection = {field: 1 for _label, field in spec.columns}
+            return {
+                "collection": spec.collection,
+                "query": query,
+                "projection": projection,
+                "sort_key": spec.sort_key,
+                "skip": skip,
+                "limit": self._page_size,
+            }
+
+        projection: Dict[str, Any] = {
+            field: 1 for _label, field in spec.columns if field != spec.truncate_field
+        }
+        # $strLenCP (and $substrCP) error out on null/missing fields, which
+        # would fail the whole aggregation and blank the tab over one bad
+        # document; coalesce to "" so such rows just render empty.
+        field_ref = {"$ifNull": [f"${spec.truncate_field}", ""]}
+        projection[spec.truncate_field] = {"$concat": [
+            {"$substrCP": [field_ref, 0, MongoDocsModel.MAX_CELL_CHARS]},
+            {"$cond": [
+                {"$gt": [{"$strLenCP": field_ref}, MongoDocsModel.MAX_CELL_CHARS]},
+                "...", ""]},
+        ]}
+        return {
+            "collection": spec.collection,
+            "pipeline": [
+                {"$match": query},
+                {"$sort": {spec.sort_key: -1}},
+                {"$skip": skip},
+                {"$limit": self._page_size},
+                {"$project": projection},
+            ],
+        }
+
+    # --- Details ---
+
+    def _on_row_clicked(self, index):
+        """Shared clicked slot for all four tables.
+
+        A single bound-method connection per view replaces per-view capturing
+        lambdas; the sender view keys into _detail_specs for the tab context.
+        """
+        spec = self._detail_specs.get(self.sender())
+        if spec is None:
+            return
+        title, model, collection = spec
+        self._show_row_details(title, model, collection, index)
+
+    def _show_row_details(self, title: str, model: MongoDocsModel, collection, index):
+        """Opens the detail dialog for the clicked row.
+
+        The tables only hold projected/truncated previews, so the full
+        document is fetched here, on demand, by _id.
+        """
+        document = model.document(index.row())
+        if document is None:
+            return
+        if "_id" in document:
+            try:
+                full_doc = collection.find_one({"_id": document["_id"]})
+                if full_doc is not None:
+                    document = full_doc
+            except Exception as e:
+                logger.error(f"Failed to fetch full document for details view: {e}", exc_info=True)
+        self.show_details(title, document)
+
+    def show_details(self, title: str, document: Dict[str, Any]):
+        """Shows the full document in a read-only dialog."""
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"{title} Details")
+        dialog.resize(600, 400)
+        layout = QVBoxLayout(dialog)
+
+        text_edit = QTextEdit()
+        text_edit.setReadOnly(True)
+        # Single join instead of quadratic += concatenation, and values are
+        # escaped so document content can't inject markup into the view.
+        parts = [
+            f"<b>{html.escape(str(key))}:</b> "
+            + html.escape(self.format_timestamp(value)
+                          if key in ("timestamp", "created_at") else str(value))
+            for key, value in document.items() if key != "_id"
+        ]
+        text_edit.setHtml("<br>".join(parts))
+        layout.addWidget(text_edit)
+
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(dialog.accept)
+        layout.addWidget(close_button)
+
+        dialog.exec()
+
+    # --- Formatting ---
+
+    def format_timestamp(self, value: Any) -> str:
+        """Formats a BSON datetime or ISO-format string for display."""
+        if isinstance(value, datetime.datetime):
+            return value.strftime(_TS_FMT)
+        if isinstance(value, str):
+            return _fmt_ts_str(value)
+        return str(value)
+
+    # --- Overrides ---
+
+    def closeEvent(self, event):
+        """Stops the fetch thread with the dialog.
+
+        The MongoClient is shared process-wide (get_mongo_client) and is
+        closed at interpreter exit, not here.
+        """
+        thread = getattr(self, "_fetch_thread", None)
+        if thread is not None:
+            thread.quit()
+            thread.wait(2000)
+        event.accept()
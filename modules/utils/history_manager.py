@@ -2,8 +2,9 @@ import logging
 from collections import deque
 from typing import Dict, List, Optional, Deque, Any, Callable # Add Callable
 
-# Langchain message types
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, BaseMessage
+# Langchain message types are only needed by get_langchain_history and are
+# imported there lazily: pulling langchain_core at module import time costs
+# hundreds of ms that most HistoryManager users never need.
 
 logger = logging.getLogger(__name__)
 
@@ -78,12 +79,14 @@ class HistoryManager:
         """Returns the history for an agent as a list of dictionaries."""
         return list(self._get_history_deque(agent_id))
 
-    def get_langchain_history(self, agent_id: str) -> List[BaseMessage]:
+    def get_langchain_history(self, agent_id: str) -> List["BaseMessage"]:
         """
         Returns the history formatted as a list of LangChain BaseMessage objects.
         """
+        from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
         history_dicts = self.get_history(agent_id)
-        messages: List[BaseMessage] = []
+        messages: List[Any] = []
         for msg_dict in history_dicts:
             msg_type = msg_dict.get("type")
             content = msg_dict.get("content", "")
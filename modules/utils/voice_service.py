@@ -0,0 +1,120 @@
+import logging
+import queue
+import threading
+from typing import Any, Dict, Optional
+
+# pyttsx3 is an optional dependency: without it the service still accepts
+# commands and simply logs the text it would have spoken.
+try:
+    import pyttsx3
+    PYTTSX3_AVAILABLE = True
+except ImportError:
+    pyttsx3 = None
+    PYTTSX3_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Queued after stop_event is set so a worker blocked in get() wakes
+# immediately instead of waiting out its timeout.
+_SENTINEL = object()
+
+
+class VoiceService:
+    """
+    Background text-to-speech service.
+
+    Commands ('speak', 'stop') are queued from any thread and processed by a
+    single worker. The worker is event-driven: it blocks on the queue's
+    condition variable via get(timeout=...) and wakes the moment a command
+    is put, rather than polling on a fixed interval.
+    """
+
+    def __init__(self):
+        self.command_queue: "queue.Queue[Any]" = queue.Queue()
+        self.stop_event = threading.Event()
+        self.worker_thread: Optional[threading.Thread] = None
+        self.engine = None
+        if PYTTSX3_AVAILABLE:
+            try:
+                self.engine = pyttsx3.init()
+            except Exception as e:
+                logger.warning(f"Could not initialize TTS engine: {e}")
+
+    def start(self):
+        """Starts the command worker thread if it is not already running."""
+        if self.worker_thread is not None and self.worker_thread.is_alive():
+            return
+        self.stop_event.clear()
+        # Drop any sentinel a previous shutdown left behind (e.g. the old
+        # worker exited on stop_event before dequeuing it); otherwise the
+        # new worker would consume it and die immediately. Queued real
+        # commands are preserved in order.
+        pending = []
+        try:
+            while True:
+                item = self.command_queue.get_nowait()
+                self.command_queue.task_done()
+                if item is not _SENTINEL:
+                    pending.append(item)
+        except queue.Empty:
+            pass
+        for item in pending:
+            self.command_queue.put(item)
+        self.worker_thread = threading.Thread(
+            target=self._process_commands, name="VoiceService", daemon=True)
+        self.worker_thread.start()
+        logger.info("VoiceService worker started.")
+
+    def speak(self, text: str):
+        """Queues text for speech; returns immediately."""
+        self.command_queue.put({"command": "speak", "text": text})
+
+    def stop(self):
+        """Stops the worker and waits briefly for it to exit."""
+        self.stop_event.set()
+        worker = self.worker_thread
+        if worker is not None and worker.is_alive():
+            # Wake a worker blocked in get() right away; without this,
+            # shutdown would wait for the get() timeout to lapse. Only done
+            # for a live worker so a stop() without a start() (or a second
+            # stop()) doesn't leave a stale sentinel for the next worker.
+            self.command_queue.put(_SENTINEL)
+            worker.join(timeout=2.0)
+        self.worker_thread = None
+        logger.info("VoiceService worker stopped.")
+
+    def _process_commands(self):
+        """Worker loop: blocks on the queue until a command (or the shutdown
+        sentinel) arrives. No polling interval, so command latency is the
+        queue wakeup itself and an idle service sleeps on a condition
+        variable instead of burning CPU.
+        """
+        while not self.stop_event.is_set():
+            try:
+                command = self.command_queue.get(timeout=0.25)
+            except queue.Empty:
+                continue
+            try:
+                if command is _SENTINEL:
+                    break
+                self._handle_command(command)
+            except Exception as e:
+                logger.error(f"Error handling voice command {command}: {e}", exc_info=True)
+            finally:
+                self.command_queue.task_done()
+
+    def _handle_command(self, command: Dict[str, Any]):
+        """Executes a single dequeued command."""
+        name = command.get("command")
+        if name == "speak":
+            text = command.get("text", "")
+            if self.engine is not None:
+                self.engine.say(text)
+                self.engine.runAndWait()
+            else:
+                logger.info(f"[voice unavailable] Would speak: {text}")
+        elif name == "stop":
+            if self.engine is not None:
+                self.engine.stop()
+        else:
+            logger.warning(f"Unknown voice command: {name}")
@@ -0,0 +1,96 @@
+"""
+One-off migration: point main_desktop.py at SimpleAgent instead of the old
+SimpleReActAgent. Run from the project root:
+
+    python update_to_simple_agent.py
+"""
+import os
+import re
+import shutil
+import hashlib
+
+MAIN_DESKTOP = "main_desktop.py"
+BACKUP_SUFFIX = ".bak2"
+# Fingerprint of the file as this script last left it; a matching stamp
+# means a re-run can stop after one read instead of rewriting everything.
+STAMP_FILE = ".update_to_simple_agent.stamp"
+
+# The class and its module follow the same rename rule, so a single compiled
+# alternation rewrites both in one scan of the file instead of one full
+# str.replace pass per token.
+_RENAMES = {
+    "SimpleReActAgent": "SimpleAgent",
+    "simple_react_agent": "simple_agent",
+}
+_RENAME_PATTERN = re.compile("|".join(_RENAMES))
+
+
+def update_main_desktop(path: str = MAIN_DESKTOP) -> bool:
+    """Rewrites the agent references in main_desktop.py.
+
+    Transforms line by line into one encoded output buffer, emits it with a
+    single os.write on a raw binary fd (no TextIOWrapper re-encode, no
+    buffered flushes), and publishes with an atomic os.replace -- there is
+    no window where main_desktop.py is partially written. Returns True if
+    the file was modified.
+    """
+    stamp_path = os.path.join(os.path.dirname(path) or ".", STAMP_FILE)
+    try:
+        with open(stamp_path, "rb") as f:
+            old_stamp = f.read()
+    except OSError:
+        old_stamp = b""  # no stamp yet, or unreadable: do the work
+
+    # One pass computes the source fingerprint and the transform together,
+    # accumulating already-encoded bytes: unchanged lines reuse their raw
+    # bytes with no decode/encode round trip. Splitting on newlines is safe
+    # for the hash because UTF-8 continuation bytes can never be 0x0A.
+    src_hasher = hashlib.blake2b(digest_size=16)
+    changed = False
+    out = bytearray()
+    with open(path, "rb") as src:
+        for raw_line in src:
+            src_hasher.update(raw_line)
+            line = raw_line.decode("utf-8")
+            new_line = _RENAME_PATTERN.sub(lambda m: _RENAMES[m.group(0)], line)
+            if new_line != line:
+                changed = True
+                out += new_line.encode("utf-8")
+            else:
+                out += raw_line
+
+    if src_hasher.digest() == old_stamp:
+        print(f"{path} already migrated (stamp matches); nothing to do.")
+        return False
+
+    if not changed:
+        # Already in the target form; stamp it so the next run short-circuits.
+        with open(stamp_path, "wb") as f:
+            f.write(src_hasher.digest())
+        print(f"No SimpleReActAgent references found in {path}; nothing to do.")
+        return False
+
+    # Back up the original with a kernel-side copy, stage the output with a
+    # single raw write (looping only if the kernel takes a short write),
+    # then swap it into place atomically.
+    shutil.copyfile(path, path + BACKUP_SUFFIX)
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(out)
+        while view:
+            view = view[os.write(fd, view):]
+    except BaseException:
+        os.close(fd)
+        os.remove(tmp_path)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, path)
+    with open(stamp_path, "wb") as f:
+        f.write(hashlib.blake2b(out, digest_size=16).digest())
+    print(f"Updated {path} to use SimpleAgent (backup at {path + BACKUP_SUFFIX}).")
+    return True
+
+
+if __name__ == "__main__":
+    update_main_desktop()